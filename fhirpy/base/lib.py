@@ -1,23 +1,28 @@
-import json
-import copy
+import asyncio
 import logging
 import warnings
 from abc import ABC, abstractmethod
-from json import JSONDecodeError
+from types import MappingProxyType
 
 import aiohttp
 import requests
 import urllib
+from requests.adapters import HTTPAdapter
 
 from yarl import URL
 from fhirpy.base.searchset import AbstractSearchSet
 from fhirpy.base.resource import BaseResource, BaseReference
 from fhirpy.base.utils import (
-    AttrDict,
+    chunks,
+    dump_json,
     encode_params,
+    get_content_type_charset,
+    load_attrdict_json,
+    load_json,
     get_by_path,
     parse_pagination_url,
     remove_prefix,
+    wrap_attrdict,
 )
 from fhirpy.base.exceptions import (
     ResourceNotFound,
@@ -27,15 +32,80 @@ from fhirpy.base.exceptions import (
 )
 
 
+def _decode_body(body, charset=None):
+    try:
+        return body.decode(charset or "utf-8", errors="replace")
+    except LookupError:
+        return body.decode("utf-8", errors="replace")
+
+
+def _raise_for_error(status, body, charset=None):
+    """
+    Raises an exception for the unsuccessful response using its raw body,
+    it's decoded with the charset of the response (UTF-8 by default)
+    only when the text is used in the exception
+    """
+    if status == 404 or status == 410:
+        raise ResourceNotFound(_decode_body(body, charset))
+
+    if status == 412:
+        raise MultipleResourcesFound(_decode_body(body, charset))
+
+    try:
+        data = load_json(body)
+    except ValueError as exc:
+        raise OperationOutcome(reason=_decode_body(body, charset)) from exc
+
+    if isinstance(data, dict) and data.get("resourceType") == "OperationOutcome":
+        raise OperationOutcome(resource=data)
+    raise OperationOutcome(reason=_decode_body(body, charset))
+
+
 class AbstractClient(ABC):
-    url = None
-    authorization = None
-    extra_headers = None
+    _url = None
+    _authorization = None
+    _extra_headers = None
 
     def __init__(self, url, authorization=None, extra_headers=None):
         self.url = url
-        self.authorization = authorization
-        self.extra_headers = extra_headers
+        self._authorization = authorization
+        self._extra_headers = None if extra_headers is None else {**extra_headers}
+        self._update_request_headers()
+
+    @property
+    def url(self):
+        return self._url
+
+    @url.setter
+    def url(self, value):
+        self._url = value
+        # Base url parts are used to build every request url, so they are parsed only once
+        url = URL(value)
+        self._url_stripped = value.rstrip("/")
+        self._url_prefix = f"{self._url_stripped}/" if url.is_absolute() else None
+        self._url_port = urllib.parse.urlparse(value).port
+        self._base_url_path = url.path.lstrip("/") + "/"
+
+    @property
+    def authorization(self):
+        return self._authorization
+
+    @authorization.setter
+    def authorization(self, value):
+        self._authorization = value
+        self._update_request_headers()
+
+    @property
+    def extra_headers(self):
+        # Headers are cached, so they can be changed only by reassigning `extra_headers`
+        if self._extra_headers is None:
+            return None
+        return MappingProxyType(self._extra_headers)
+
+    @extra_headers.setter
+    def extra_headers(self, value):
+        self._extra_headers = None if value is None else {**value}
+        self._update_request_headers()
 
     def __str__(self):  # pragma: no cover
         return f"<{self.__class__.__name__} {self.url}>"
@@ -71,141 +141,256 @@ class AbstractClient(ABC):
         pass
 
     @abstractmethod  # pragma: no cover
-    def _do_request(self, method, path, data=None, params=None, returning_status=False):
+    def _do_request(
+        self,
+        method,
+        path,
+        data=None,
+        params=None,
+        returning_status=False,
+        json_loader=load_attrdict_json,
+    ):
         pass
 
     @abstractmethod  # pragma: no cover
     def _fetch_resource(self, path, params=None):
         pass
 
-    def _build_request_headers(self):
+    def _update_request_headers(self):
+        # Headers are the same for all requests, so they are built only once
+        # when the client is created or authorization/extra_headers are changed
         headers = {"Accept": "application/fhir+json"}
 
-        if self.authorization:
-            headers["Authorization"] = self.authorization
+        if self._authorization:
+            headers["Authorization"] = self._authorization
 
-        if self.extra_headers is not None:
-            headers = {**headers, **self.extra_headers}
+        if self._extra_headers is not None:
+            headers.update(self._extra_headers)
 
-        return headers
+        self._request_headers = MappingProxyType(
+            {**headers, "Content-Type": "application/fhir+json"}
+        )
+        self._patch_request_headers = MappingProxyType(
+            {**headers, "Content-Type": "application/json-patch+json"}
+        )
 
     def _build_request_url(self, path, params):
+        # Absolute links to the server (e.g. Bundle `next` links) are requested as is
+        if self._url_prefix and path.startswith(self._url_prefix):
+            return path
         if URL(path).is_absolute():
-            if urllib.parse.urlparse(self.url).port:
+            if self._url_port:
                 parsed = urllib.parse.urlparse(path)
                 if parsed.port is None and parsed.scheme == "https":
                     path = f'{parsed.scheme}://{parsed.netloc}:443{parsed.path}?{parsed.query}'
                     if parsed.fragment != "":
                         path += f'#{parsed.fragment}'
-            if self.url.rstrip("/") in path.rstrip("/"):
+            if self._url_stripped in path.rstrip("/"):
                 return path
             raise ValueError(
                 f'Request url "{path}" does not contain base url "{self.url}"'
                 " (possible security issue)"
             )
-        path = path.lstrip("/")
-        base_url_path = URL(self.url).path.lstrip("/") + "/"
-        path = remove_prefix(path, base_url_path)
-        params = params or {}
+        path = remove_prefix(path.lstrip("/"), self._base_url_path)
+        url = f'{self._url_stripped}/{path.lstrip("/")}'
 
-        return f'{self.url.rstrip("/")}/{path.lstrip("/")}?{encode_params(params)}'
+        return f"{url}?{encode_params(params)}" if params else url
 
 
 class AsyncClient(AbstractClient, ABC):
     aiohttp_config = None
+    _session = None
+    _session_loop = None
 
     def __init__(self, url, authorization=None, extra_headers=None, aiohttp_config=None):
         self.aiohttp_config = aiohttp_config or {}
+        self._background_tasks = set()
 
         super().__init__(url, authorization, extra_headers)
 
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
     async def execute(self, path, method="post", **kwargs):
         return await self._do_request(method, path, **kwargs)
 
-    async def _do_request(self, method, path, data=None, params=None, returning_status=False):
-        headers = self._build_request_headers()
-        url = self._build_request_url(path, params)
-        if method == 'patch':
-            headers['Content-Type'] = 'application/json-patch+json'
-        async with aiohttp.ClientSession(headers=headers) as session:
-            async with session.request(method, url, json=data, **self.aiohttp_config) as r:
-                if 200 <= r.status < 300:
-                    data = await r.text()
-                    r_data = json.loads(data, object_hook=AttrDict) if data else None
-                    return (r_data, r.status) if returning_status else r_data
-
-                if r.status == 404 or r.status == 410:
-                    raise ResourceNotFound(await r.text())
-
-                if r.status == 412:
-                    raise MultipleResourcesFound(await r.text())
-
-                data = await r.text()
+    async def fetch_many(self, resource_type, ids, batch_size=100, max_concurrency=20):
+        """
+        Returns resources of `resource_type` with specified ids
+        using `_id` search with up to `batch_size` ids per request
+        and up to `max_concurrency` searches at the same time
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(batch):
+            async with semaphore:
+                return await self.resources(resource_type).search(_id=",".join(batch)).fetch_all()
+
+        pages = await asyncio.gather(*(fetch(batch) for batch in chunks(list(ids), batch_size)))
+        return [resource for page in pages for resource in page]
+
+    async def resolve_many(self, references, max_concurrency=20):
+        """
+        Returns resources for references resolving them concurrently
+        with up to `max_concurrency` requests at the same time
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def resolve(reference):
+            async with semaphore:
+                return await reference.to_resource()
+
+        return await asyncio.gather(*(resolve(reference) for reference in references))
+
+    async def close(self):
+        """
+        Cancels pending background requests (e.g. prefetch of the next page),
+        closes the underlying aiohttp session and releases pooled connections
+        """
+        if self._background_tasks:
+            loop = asyncio.get_running_loop()
+            tasks = [task for task in self._background_tasks if task.get_loop() is loop]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+
+    def _run_in_background(self, coro):
+        # Background tasks are tracked to cancel them on close,
+        # otherwise they could create a new session after the client is closed
+        task = asyncio.ensure_future(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+
+    async def _get_session(self):
+        # The session is bound to the event loop it was created in,
+        # so a new one is required when the client is used from another loop
+        loop = asyncio.get_running_loop()
+        session = self._session
+        if session is None or session.closed or self._session_loop is not loop:
+            # The new session is set before closing the stale one,
+            # so concurrent requests don't create several sessions
+            stale_session, session = session, aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300)
+            )
+            self._session, self._session_loop = session, loop
+            if stale_session is not None and not stale_session.closed:
+                # Connections of the stale session can't be reused, so it's closed
+                # to avoid leaking it (e.g. after several `asyncio.run()` calls)
                 try:
-                    parsed_data = json.loads(data)
-                    if parsed_data["resourceType"] == "OperationOutcome":
-                        raise OperationOutcome(resource=parsed_data)
-                    raise OperationOutcome(reason=data)
-                except (KeyError, JSONDecodeError):
-                    raise OperationOutcome(reason=data)
+                    await stale_session.close()
+                except RuntimeError:  # pragma: no cover
+                    pass
+        return session
+
+    async def _do_request(
+        self,
+        method,
+        path,
+        data=None,
+        params=None,
+        returning_status=False,
+        json_loader=load_attrdict_json,
+    ):
+        headers = self._patch_request_headers if method == 'patch' else self._request_headers
+        url = self._build_request_url(path, params)
+        # Already serialized payload (e.g. reused for retries) is sent as is
+        body = data if data is None or isinstance(data, bytes) else dump_json(data)
+        session = await self._get_session()
+        async with session.request(
+            method, url, data=body, headers=headers, **self.aiohttp_config
+        ) as r:
+            if 200 <= r.status < 300:
+                r_data = None
+                # Don't wait for the body if the response has no content
+                if r.status != 204 and r.content_length != 0:
+                    data = await r.read()
+                    r_data = json_loader(data) if data else None
+                return (r_data, r.status) if returning_status else r_data
+
+            _raise_for_error(r.status, await r.read(), r.charset)
 
     async def _fetch_resource(self, path, params=None):
-        return await self._do_request("get", path, params=params)
+        return await self._do_request("get", path, params=params, json_loader=load_json)
 
 
 class SyncClient(AbstractClient, ABC):
     requests_config = None
+    _requests_session = None
+    _owned_session = None
 
     def __init__(
             self, url, authorization=None, extra_headers=None, requests_config=None, timeout=120
     ):
-        self.requests_config = requests_config or {}
+        # The session is kept apart so the rest of the config is passed to every request as is
+        self.requests_config = {**(requests_config or {})}
+        self._requests_session = self.requests_config.pop('session', None)
         if 'timeout' not in self.requests_config:
             self.requests_config['timeout'] = timeout
+        if not self._requests_session:
+            # Keep connections alive between requests unless a session is provided
+            self._owned_session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=10, pool_maxsize=100)
+            self._owned_session.mount("http://", adapter)
+            self._owned_session.mount("https://", adapter)
+            self._requests_session = self._owned_session
 
         super().__init__(url, authorization, extra_headers)
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
     def execute(self, path, method="post", **kwargs):
         return self._do_request(method, path, **kwargs)
 
-    def _do_request(self, method, path, data=None, params=None, returning_status=False):
-        headers = self._build_request_headers()
-        headers['Content-Type'] = 'application/fhir+json'
-        if method == 'patch':
-            headers['Content-Type'] = 'application/json-patch+json'
+    def close(self):
+        """
+        Closes the session created by the client and releases pooled connections,
+        a session provided in `requests_config` is left open
+        """
+        if self._owned_session is not None:
+            self._owned_session.close()
+
+    def _do_request(
+        self,
+        method,
+        path,
+        data=None,
+        params=None,
+        returning_status=False,
+        json_loader=load_attrdict_json,
+    ):
+        headers = self._patch_request_headers if method == 'patch' else self._request_headers
         url = self._build_request_url(path, params)
-        if session := self.requests_config.pop('session', None):
-            r = session.request(
-                method, url, json=data, headers=headers, **self.requests_config,
-            )
-            # now add it again for the next request
-            self.requests_config['session'] = session
-        else:
-            r = requests.request(
-                method, url, json=data, headers=headers, **self.requests_config,
-            )
+        # Already serialized payload (e.g. reused for retries) is sent as is
+        body = data if data is None or isinstance(data, bytes) else dump_json(data)
+        r = self._requests_session.request(
+            method, url, data=body, headers=headers, **self.requests_config
+        )
 
         if 200 <= r.status_code < 300:
-            r_data = json.loads(r.content.decode(), object_hook=AttrDict) if r.content else None
+            r_data = None
+            if r.status_code != 204 and r.headers.get("Content-Length") != "0":
+                r_data = json_loader(r.content) if r.content else None
             return (r_data, r.status_code) if returning_status else r_data
 
-        if r.status_code == 404 or r.status_code == 410:
-            raise ResourceNotFound(r.content.decode())
-
-        if r.status_code == 412:
-            raise MultipleResourcesFound(r.content.decode())
-
-        data = r.content.decode()
-        try:
-            parsed_data = json.loads(data)
-            if parsed_data["resourceType"] == "OperationOutcome":
-                raise OperationOutcome(resource=parsed_data)
-            raise OperationOutcome(reason=data)
-        except (KeyError, JSONDecodeError) as exc:
-            raise OperationOutcome(reason=data) from exc
+        # Unlike `r.encoding`, only the charset stated in the header is used,
+        # requests falls back to ISO-8859-1 for text responses otherwise
+        charset = get_content_type_charset(r.headers.get("Content-Type"))
+        _raise_for_error(r.status_code, r.content, charset)
 
     def _fetch_resource(self, path, params=None):
-        return self._do_request("get", path, params=params)
+        return self._do_request("get", path, params=params, json_loader=load_json)
 
 
 class SyncSearchSet(AbstractSearchSet, ABC):
@@ -219,13 +404,17 @@ class SyncSearchSet(AbstractSearchSet, ABC):
         data_resource_type = data.get("resourceType", None)
 
         if data_resource_type == "Bundle":
-            for item in data["entry"]:
-                item.resource = self._dict_to_resource(item.resource)
+            dict_to_resource = self._dict_to_resource
+            for item in data.get("entry") or []:
+                item["resource"] = dict_to_resource(item["resource"])
 
-        return data
+        return wrap_attrdict(data)
 
     def fetch_all(self):
-        return list(x for x in self)
+        resources = []
+        for page in self._iter_pages():
+            resources.extend(page)
+        return resources
 
     def get(self, id=None):
         searchset = self.limit(2)
@@ -247,7 +436,7 @@ class SyncSearchSet(AbstractSearchSet, ABC):
         return self._dict_to_resource(resource)
 
     def count(self):
-        new_params = copy.deepcopy(self.params)
+        new_params = {**self.params}
         new_params["_count"] = 0
         new_params["_totalMethod"] = "count"
 
@@ -288,17 +477,27 @@ class SyncSearchSet(AbstractSearchSet, ABC):
         )
 
     def __iter__(self):
+        for page in self._iter_pages():
+            yield from page
+
+    def _iter_pages(self):
+        """
+        Yields lists of resources page by page following Bundle `next` links
+        """
+        fetch_resource = self.client._fetch_resource
+        get_bundle_resources = self._get_bundle_resources
+        next_link_path = ["link", {"relation": "next"}, "url"]
+
         next_link = None
         while True:
             if next_link:
-                bundle_data = self.client._fetch_resource(*parse_pagination_url(next_link))
+                bundle_data = fetch_resource(*parse_pagination_url(next_link))
             else:
-                bundle_data = self.client._fetch_resource(self.resource_type, self.params)
-            new_resources = self._get_bundle_resources(bundle_data)
-            next_link = get_by_path(bundle_data, ["link", {"relation": "next"}, "url"])
+                bundle_data = fetch_resource(self.resource_type, self.params)
+            new_resources = get_bundle_resources(bundle_data)
+            next_link = get_by_path(bundle_data, next_link_path)
 
-            for item in new_resources:
-                yield item
+            yield new_resources
 
             if not next_link:
                 break
@@ -315,13 +514,17 @@ class AsyncSearchSet(AbstractSearchSet, ABC):
         data_resource_type = data.get("resourceType", None)
 
         if data_resource_type == "Bundle":
-            for item in data["entry"]:
-                item.resource = self._dict_to_resource(item.resource)
+            dict_to_resource = self._dict_to_resource
+            for item in data.get("entry") or []:
+                item["resource"] = dict_to_resource(item["resource"])
 
-        return data
+        return wrap_attrdict(data)
 
     async def fetch_all(self):
-        return list(x async for x in self)
+        resources = []
+        async for page in self._iter_pages():
+            resources.extend(page)
+        return resources
 
     async def get(self, id=None):
         searchset = self.limit(2)
@@ -343,7 +546,7 @@ class AsyncSearchSet(AbstractSearchSet, ABC):
         return self._dict_to_resource(resource)
 
     async def count(self):
-        new_params = copy.deepcopy(self.params)
+        new_params = {**self.params}
         new_params["_count"] = 0
         new_params["_totalMethod"] = "count"
 
@@ -384,20 +587,47 @@ class AsyncSearchSet(AbstractSearchSet, ABC):
         )
 
     async def __aiter__(self):
-        next_link = None
-        while True:
-            if next_link:
-                bundle_data = await self.client._fetch_resource(*parse_pagination_url(next_link))
-            else:
-                bundle_data = await self.client._fetch_resource(self.resource_type, self.params)
-            new_resources = self._get_bundle_resources(bundle_data)
-            next_link = get_by_path(bundle_data, ["link", {"relation": "next"}, "url"])
-
-            for item in new_resources:
-                yield item
+        pages = self._iter_pages()
+        try:
+            async for page in pages:
+                for item in page:
+                    yield item
+        finally:
+            # Cancel prefetch of the next page when the iteration is stopped
+            await pages.aclose()
+
+    async def _iter_pages(self):
+        """
+        Yields lists of resources page by page following Bundle `next` links.
+        The next page is requested in background while the current one is processed
+        """
+        fetch_resource = self.client._fetch_resource
+        get_bundle_resources = self._get_bundle_resources
+        next_link_path = ["link", {"relation": "next"}, "url"]
 
-            if not next_link:
-                break
+        next_page_task = None
+        try:
+            bundle_data = await fetch_resource(self.resource_type, self.params)
+            while True:
+                next_link = get_by_path(bundle_data, next_link_path)
+                if next_link:
+                    next_page_task = self.client._run_in_background(
+                        fetch_resource(*parse_pagination_url(next_link))
+                    )
+
+                yield get_bundle_resources(bundle_data)
+
+                if not next_page_task:
+                    break
+                bundle_data = await next_page_task
+                next_page_task = None
+        finally:
+            if next_page_task is not None:
+                if next_page_task.done() and not next_page_task.cancelled():
+                    # Retrieve the result to avoid "exception was never retrieved" warning
+                    next_page_task.exception()
+                else:
+                    next_page_task.cancel()
 
 
 class SyncResource(BaseResource, ABC):
@@ -406,22 +636,13 @@ class SyncResource(BaseResource, ABC):
         if fields:  # Use FHIRPatch if fields for partial update are defined http://hl7.org/fhir/http.html#patch
             if not self.id:
                 raise TypeError("Resource `id` is required for update operation")
-            request_data = []
-            for key in fields:
-                operator = 'add'  # TODO add logic to support other operators
-                request_data.append(
-                    {
-                        'op': operator,
-                        'path': f'/{key}',
-                        'value': data[key]
-                    }
-                )
-            data = request_data
+            # TODO add logic to support other operators
+            data = [{'op': 'add', 'path': f'/{key}', 'value': data[key]} for key in fields]
             method = "patch"
         else:
             method = "put" if self.id else "post"
         response_data = self.client._do_request(
-            method, self._get_path(), data=data, params=search_params
+            method, self._get_path(), data=data, params=search_params, json_loader=load_json
         )
         if response_data:
             super(BaseResource, self).clear()
@@ -446,13 +667,13 @@ class SyncResource(BaseResource, ABC):
         return self.client._do_request("delete", self._get_path())
 
     def refresh(self):
-        data = self.client._do_request("get", self._get_path())
+        data = self.client._do_request("get", self._get_path(), json_loader=load_json)
         super(BaseResource, self).clear()
-        super(BaseResource, self).update(**data)
+        super(BaseResource, self).update(**self.client.resource(self.resource_type, **data))
 
     def is_valid(self, raise_exception=False):
         data = self.client._do_request(
-            "post", "{0}/$validate".format(self.resource_type), data=self.serialize()
+            "post", f"{self.resource_type}/$validate", data=self.serialize()
         )
         if any(issue["severity"] in ["fatal", "error"] for issue in data["issue"]):
             if raise_exception:
@@ -463,7 +684,7 @@ class SyncResource(BaseResource, ABC):
     def execute(self, operation, method="post", data=None, params=None):
         return self.client._do_request(
             method,
-            "{0}/{1}".format(self._get_path(), operation),
+            f"{self._get_path()}/{operation}",
             data=data,
             params=params,
         )
@@ -481,7 +702,7 @@ class AsyncResource(BaseResource, ABC):
             method = "put" if self.id else "post"
 
         response_data = await self.client._do_request(
-            method, self._get_path(), data=data, params=search_params
+            method, self._get_path(), data=data, params=search_params, json_loader=load_json
         )
         if response_data:
             super(BaseResource, self).clear()
@@ -506,16 +727,16 @@ class AsyncResource(BaseResource, ABC):
         return await self.client._do_request("delete", self._get_path())
 
     async def refresh(self):
-        data = await self.client._do_request("get", self._get_path())
+        data = await self.client._do_request("get", self._get_path(), json_loader=load_json)
         super(BaseResource, self).clear()
-        super(BaseResource, self).update(**data)
+        super(BaseResource, self).update(**self.client.resource(self.resource_type, **data))
 
     async def to_resource(self):
         return super(AsyncResource, self).to_resource()
 
     async def is_valid(self, raise_exception=False):
         data = await self.client._do_request(
-            "post", "{0}/$validate".format(self.resource_type), data=self.serialize()
+            "post", f"{self.resource_type}/$validate", data=self.serialize()
         )
         if any(issue["severity"] in ["fatal", "error"] for issue in data["issue"]):
             if raise_exception:
@@ -525,7 +746,7 @@ class AsyncResource(BaseResource, ABC):
 
     async def execute(self, operation, method="post", **kwargs):
         return await self.client._do_request(
-            method, "{0}/{1}".format(self._get_path(), operation), **kwargs
+            method, f"{self._get_path()}/{operation}", **kwargs
         )
 
 
@@ -538,7 +759,7 @@ class SyncReference(BaseReference, ABC):
         if not self.is_local:
             raise ResourceNotFound("Can not resolve not local resource")
         resource_data = self.client._do_request(
-            "get", "{0}/{1}".format(self.resource_type, self.id)
+            "get", f"{self.resource_type}/{self.id}", json_loader=load_json
         )
         return self._dict_to_resource(resource_data)
 
@@ -547,7 +768,7 @@ class SyncReference(BaseReference, ABC):
             raise ResourceNotFound("Can not execute on not local resource")
         return self.client._do_request(
             method,
-            "{0}/{1}/{2}".format(self.resource_type, self.id, operation),
+            f"{self.resource_type}/{self.id}/{operation}",
             **kwargs,
         )
 
@@ -561,7 +782,7 @@ class AsyncReference(BaseReference, ABC):
         if not self.is_local:
             raise ResourceNotFound("Can not resolve not local resource")
         resource_data = await self.client._do_request(
-            "get", "{0}/{1}".format(self.resource_type, self.id)
+            "get", f"{self.resource_type}/{self.id}", json_loader=load_json
         )
         return self._dict_to_resource(resource_data)
 
@@ -570,6 +791,6 @@ class AsyncReference(BaseReference, ABC):
             raise ResourceNotFound("Can not execute on not local resource")
         return await self.client._do_request(
             method,
-            "{0}/{1}/{2}".format(self.resource_type, self.id, operation),
+            f"{self.resource_type}/{self.id}/{operation}",
             **kwargs,
         )
@@ -160,11 +160,11 @@ class BaseResource(AbstractResource, ABC):
         Returns reference if local resource is saved
         """
         if self.id:
-            return "{0}/{1}".format(self.resource_type, self.id)
+            return f"{self.resource_type}/{self.id}"
 
     def _get_path(self):
         if self.id:
-            return "{0}/{1}".format(self.resource_type, self.id)
+            return f"{self.resource_type}/{self.id}"
         elif self.resource_type == "Bundle":
             return ""
 
@@ -1,7 +1,13 @@
+import json
 import reprlib
 from urllib.parse import urlencode, quote, parse_qs, urlparse
 from yarl import URL
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 
 class AttrDict(dict):
     def __init__(self, *args, **kwargs):
@@ -66,6 +72,74 @@ def encode_params(params):
     )
 
 
+def load_json(data):
+    """
+    Parses JSON document (bytes or str) into plain python objects
+
+    >>> load_json(b'{"entry": [{"resource": {"id": "p1"}}]}')
+    {'entry': [{'resource': {'id': 'p1'}}]}
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_attrdict_json(data):
+    """
+    Parses JSON document (bytes or str) wrapping all objects with AttrDict
+
+    >>> load_attrdict_json(b'{"entry": [{"resource": {"id": "p1"}}]}').entry[0].resource.id
+    'p1'
+    """
+    if orjson is not None:
+        return wrap_attrdict(orjson.loads(data))
+    return json.loads(data, object_hook=AttrDict)
+
+
+def dump_json(data):
+    """
+    Serializes data to JSON bytes
+
+    >>> dump_json({'resourceType': 'Patient', 'active': True})
+    b'{"resourceType":"Patient","active":true}'
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+def wrap_attrdict(data):
+    """
+    Recursively wraps plain dicts of parsed JSON with AttrDict,
+    instances of dict subclasses (e.g. resources) are left as is
+
+    >>> wrap_attrdict({'name': [{'text': 'John'}]}).name[0].text
+    'John'
+    """
+    if type(data) is dict:
+        return AttrDict({key: wrap_attrdict(value) for key, value in data.items()})
+    if type(data) is list:
+        return [wrap_attrdict(item) for item in data]
+    return data
+
+
+def get_content_type_charset(content_type):
+    """
+    Returns the charset stated in Content-Type header or None
+
+    >>> get_content_type_charset('text/plain; charset="cp1251"')
+    'cp1251'
+
+    >>> get_content_type_charset('text/plain') is None
+    True
+    """
+    for param in (content_type or "").split(";")[1:]:
+        key, _, value = param.partition("=")
+        if key.strip().lower() == "charset":
+            return value.strip().strip("\"'") or None
+    return None
+
+
 def parse_pagination_url(url):
     """
     Parses Bundle.link pagination url and returns path and params
@@ -79,7 +79,7 @@ class SyncFHIRClient(SyncClient):
 
     def reference(self, resource_type=None, id=None, reference=None, **kwargs):
         if resource_type and id:
-            reference = "{0}/{1}".format(resource_type, id)
+            reference = f"{resource_type}/{id}"
 
         if not reference:
             raise TypeError("Arguments `resource_type` and `id` or `reference` " "are required")
@@ -92,7 +92,7 @@ class AsyncFHIRClient(AsyncClient):
 
     def reference(self, resource_type=None, id=None, reference=None, **kwargs):
         if resource_type and id:
-            reference = "{0}/{1}".format(resource_type, id)
+            reference = f"{resource_type}/{id}"
 
         if not reference:
             raise TypeError("Arguments `resource_type` and `id` or `reference` " "are required")
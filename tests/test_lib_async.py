@@ -1,3 +1,4 @@
+import asyncio
 import json
 from math import ceil
 from unittest.mock import ANY, Mock, patch
@@ -800,5 +801,256 @@ async def test_aiohttp_config():
     with patch("aiohttp.ClientSession.request", return_value=resp) as patched_request:
         await client.resources("Patient").first()
         patched_request.assert_called_with(
-            ANY, ANY, json=None, ssl=False, proxy="http://example.com"
+            ANY, ANY, data=None, headers=ANY, ssl=False, proxy="http://example.com"
         )
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_session_is_reused():
+    client = AsyncFHIRClient(FHIR_SERVER_URL, authorization=FHIR_SERVER_AUTHORIZATION)
+    resp = MockAiohttpResponse(
+        bytes(
+            json.dumps({"resourceType": "Bundle", "type": "searchset", "total": 0, "entry": []}),
+            "utf-8",
+        ),
+        200,
+    )
+    async with client:
+        with patch("aiohttp.ClientSession.request", return_value=resp):
+            await client.resources("Patient").first()
+            session = client._session
+            await client.resources("Patient").first()
+            assert client._session is session
+    assert session.closed
+    assert client._session is None
+
+
+def test_stale_session_is_closed_in_another_loop():
+    client = AsyncFHIRClient(FHIR_SERVER_URL, authorization=FHIR_SERVER_AUTHORIZATION)
+    sessions = []
+
+    async def fetch():
+        with patch(
+            "aiohttp.ClientSession.request",
+            return_value=MockAiohttpResponse(
+                b'{"resourceType": "Bundle", "type": "searchset", "entry": []}', 200
+            ),
+        ):
+            await client.resources("Patient").first()
+        sessions.append(client._session)
+
+    async def fetch_concurrently():
+        await asyncio.gather(*(fetch() for _ in range(5)))
+
+    asyncio.run(fetch())
+    asyncio.run(fetch_concurrently())
+
+    assert len(set(sessions)) == 2
+    assert sessions[0].closed
+    asyncio.run(client.close())
+    assert sessions[-1].closed
+
+
+def make_bundle_response(ids, next_link=None):
+    bundle = {
+        "resourceType": "Bundle",
+        "type": "searchset",
+        "link": [{"relation": "next", "url": next_link}] if next_link else [],
+        "entry": [{"resource": {"resourceType": "Patient", "id": id}} for id in ids],
+    }
+    return MockAiohttpResponse(bytes(json.dumps(bundle), "utf-8"), 200)
+
+
+@pytest.mark.asyncio
+async def test_fetch_all_follows_next_link():
+    client = AsyncFHIRClient(FHIR_SERVER_URL, authorization=FHIR_SERVER_AUTHORIZATION)
+
+    responses = [
+        make_bundle_response(["p1", "p2"], f"{FHIR_SERVER_URL}/Patient?page=2"),
+        make_bundle_response(["p3"]),
+    ]
+    async with client:
+        with patch("aiohttp.ClientSession.request", side_effect=responses) as patched_request:
+            patients = await client.resources("Patient").fetch_all()
+
+    assert [patient.id for patient in patients] == ["p1", "p2", "p3"]
+    assert patched_request.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_async_for_iterator_prefetches_next_page():
+    client = AsyncFHIRClient(FHIR_SERVER_URL, authorization=FHIR_SERVER_AUTHORIZATION)
+
+    responses = [
+        make_bundle_response(["p1", "p2"], f"{FHIR_SERVER_URL}/Patient?page=2"),
+        make_bundle_response(["p3"]),
+    ]
+    async with client:
+        with patch("aiohttp.ClientSession.request", side_effect=responses) as patched_request:
+            received_ids = []
+            async for patient in client.resources("Patient"):
+                if patient.id == "p1":
+                    await asyncio.sleep(0)
+                    # The second page is requested before the first one is processed
+                    assert patched_request.call_count == 2
+                received_ids.append(patient.id)
+
+    assert received_ids == ["p1", "p2", "p3"]
+
+
+class BlockingAiohttpResponse(MockAiohttpResponse):
+    def __init__(self):
+        super().__init__(b"", 200)
+        self.started = asyncio.Event()
+        self.cancelled = False
+
+    async def __aenter__(self):
+        self.started.set()
+        try:
+            await asyncio.get_running_loop().create_future()
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+
+
+@pytest.mark.asyncio
+async def test_async_for_iterator_break_before_next_page():
+    client = AsyncFHIRClient(FHIR_SERVER_URL, authorization=FHIR_SERVER_AUTHORIZATION)
+    next_page_response = BlockingAiohttpResponse()
+    responses = [
+        make_bundle_response(["p1"], f"{FHIR_SERVER_URL}/Patient?page=2"),
+        next_page_response,
+    ]
+
+    async with client:
+        with patch("aiohttp.ClientSession.request", side_effect=responses):
+            pages = client.resources("Patient")._iter_pages()
+            page = await pages.__anext__()
+            assert [patient.id for patient in page] == ["p1"]
+            await next_page_response.started.wait()
+
+            # Pending request of the next page is cancelled
+            await pages.aclose()
+            await asyncio.sleep(0)
+
+    assert next_page_response.cancelled
+
+
+@pytest.mark.asyncio
+async def test_async_for_iterator_break_inside_client_context():
+    client = AsyncFHIRClient(FHIR_SERVER_URL, authorization=FHIR_SERVER_AUTHORIZATION)
+    responses = [
+        make_bundle_response(["p1"], f"{FHIR_SERVER_URL}/Patient?page=2"),
+        make_bundle_response(["p2"]),
+    ]
+
+    with patch("aiohttp.ClientSession.request", side_effect=responses) as patched_request:
+        async with client:
+            async for patient in client.resources("Patient"):
+                break
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+    # Prefetch of the next page is cancelled and doesn't create a new session
+    assert patched_request.call_count == 1
+    assert client._session is None
+    assert not client._background_tasks
+
+
+@pytest.mark.asyncio
+async def test_fetch_many():
+    client = AsyncFHIRClient(FHIR_SERVER_URL, authorization=FHIR_SERVER_AUTHORIZATION)
+
+    def request(method, url, **kwargs):
+        ids = parse_qs(urlparse(url).query)["_id"][0].split(",")
+        return make_bundle_response(ids)
+
+    async with client:
+        with patch("aiohttp.ClientSession.request", side_effect=request) as patched_request:
+            patients = await client.fetch_many("Patient", ["p1", "p2", "p3"], batch_size=2)
+
+    assert [patient.id for patient in patients] == ["p1", "p2", "p3"]
+    assert patched_request.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_fetch_many_max_concurrency():
+    client = AsyncFHIRClient(FHIR_SERVER_URL, authorization=FHIR_SERVER_AUTHORIZATION)
+    running = 0
+    max_running = 0
+
+    async def fetch_all(self):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0)
+        running -= 1
+        return [client.resource("Patient", id=id) for id in self.params["_id"][0].split(",")]
+
+    with patch("fhirpy.lib.AsyncFHIRSearchSet.fetch_all", fetch_all):
+        patients = await client.fetch_many(
+            "Patient", [f"p{i}" for i in range(10)], batch_size=2, max_concurrency=2
+        )
+
+    assert [patient.id for patient in patients] == [f"p{i}" for i in range(10)]
+    assert max_running == 2
+
+
+@pytest.mark.asyncio
+async def test_resolve_many():
+    client = AsyncFHIRClient(FHIR_SERVER_URL, authorization=FHIR_SERVER_AUTHORIZATION)
+
+    def request(method, url, **kwargs):
+        resource_type, id = urlparse(url).path.split("/")[-2:]
+        resource = {"resourceType": resource_type, "id": id}
+        return MockAiohttpResponse(bytes(json.dumps(resource), "utf-8"), 200)
+
+    references = [client.reference("Patient", "p1"), client.reference("Practitioner", "pr1")]
+    async with client:
+        with patch("aiohttp.ClientSession.request", side_effect=request):
+            resources = await client.resolve_many(references, max_concurrency=1)
+
+    assert [resource.reference for resource in resources] == ["Patient/p1", "Practitioner/pr1"]
+    assert all(isinstance(resource, AsyncFHIRResource) for resource in resources)
+
+
+@pytest.mark.asyncio
+async def test_delete_no_content():
+    client = AsyncFHIRClient(FHIR_SERVER_URL, authorization=FHIR_SERVER_AUTHORIZATION)
+    resp = MockAiohttpResponse(b"", 204)
+    resp.read = Mock(side_effect=AssertionError("Body of 204 response must not be read"))
+    async with client:
+        with patch("aiohttp.ClientSession.request", return_value=resp):
+            assert await client.resource("Patient", id="p1").delete() is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("status", "content", "exception"),
+    [
+        (404, b"Not found", ResourceNotFound),
+        (410, b"Gone", ResourceNotFound),
+        (412, b"Multiple matches", MultipleResourcesFound),
+        (500, b"Internal server error", OperationOutcome),
+        (400, b'{"resourceType": "Patient"}', OperationOutcome),
+    ],
+)
+async def test_error_response(status, content, exception):
+    client = AsyncFHIRClient(FHIR_SERVER_URL, authorization=FHIR_SERVER_AUTHORIZATION)
+    resp = MockAiohttpResponse(content, status)
+    async with client:
+        with patch("aiohttp.ClientSession.request", return_value=resp):
+            with pytest.raises(exception):
+                await client.reference("Patient", "p1").to_resource()
+
+
+@pytest.mark.asyncio
+async def test_error_response_charset():
+    client = AsyncFHIRClient(FHIR_SERVER_URL, authorization=FHIR_SERVER_AUTHORIZATION)
+    resp = MockAiohttpResponse("Ошибка сервера".encode("cp1251"), 500, charset="cp1251")
+    async with client:
+        with patch("aiohttp.ClientSession.request", return_value=resp):
+            with pytest.raises(OperationOutcome) as exc:
+                await client.reference("Patient", "p1").to_resource()
+    assert exc.value.resource["issue"][0]["diagnostics"] == "Ошибка сервера"
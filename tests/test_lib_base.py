@@ -1,6 +1,7 @@
 import pytest
 from fhirpy import SyncFHIRClient, AsyncFHIRClient
 from fhirpy.lib import BaseFHIRReference
+from fhirpy.base import utils
 from fhirpy.base.utils import AttrDict, SearchList, parse_pagination_url, set_by_path
 
 
@@ -214,3 +215,69 @@ class TestLibBase(object):
         assert patient["name"][0]["family"] == "Jackson"
         patient.name[0].given.append("Hellen")
         assert patient["name"][0]["given"] == ["Firstname", "Hellen"]
+
+
+@pytest.mark.parametrize("client_class", [SyncFHIRClient, AsyncFHIRClient])
+def test_authorization_reassignment_updates_headers(client_class):
+    client = client_class("mock", authorization="Bearer old")
+    client.authorization = "Bearer new"
+    assert client._request_headers["Authorization"] == "Bearer new"
+    assert client._patch_request_headers["Authorization"] == "Bearer new"
+    client.authorization = None
+    assert "Authorization" not in client._request_headers
+
+
+@pytest.mark.parametrize("client_class", [SyncFHIRClient, AsyncFHIRClient])
+def test_extra_headers_reassignment_updates_headers(client_class):
+    extra_headers = {"X-A": "1"}
+    client = client_class("mock", extra_headers=extra_headers)
+    extra_headers["X-B"] = "2"
+    assert "X-B" not in client._request_headers
+    with pytest.raises(TypeError):
+        client.extra_headers["X-B"] = "2"
+
+    client.extra_headers = {**client.extra_headers, "X-B": "2"}
+    assert client._request_headers["X-A"] == "1"
+    assert client._request_headers["X-B"] == "2"
+    assert client._patch_request_headers["X-B"] == "2"
+
+
+@pytest.mark.parametrize("client_class", [SyncFHIRClient, AsyncFHIRClient])
+def test_url_reassignment_updates_request_url(client_class):
+    client = client_class("http://old.server/fhir")
+    client.url = "https://new.server/baseR4"
+    assert client._build_request_url("Patient", None) == "https://new.server/baseR4/Patient"
+    assert (
+        client._build_request_url("/baseR4/Patient/p1", {"_count": 1})
+        == "https://new.server/baseR4/Patient/p1?_count=1"
+    )
+    with pytest.raises(ValueError):
+        client._build_request_url("http://old.server/fhir/Patient", None)
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(utils, "orjson", None)
+    return request.param
+
+
+def test_load_json(json_backend):
+    data = utils.load_json(b'{"entry": [{"resource": {"id": "p1", "active": true}}]}')
+    assert data == {"entry": [{"resource": {"id": "p1", "active": True}}]}
+    assert type(data["entry"][0]) is dict
+
+
+def test_load_attrdict_json(json_backend):
+    data = utils.load_attrdict_json('{"entry": [{"resource": {"id": "p1"}}]}'.encode())
+    assert isinstance(data.entry[0], AttrDict)
+    assert data.entry[0].resource.id == "p1"
+
+
+def test_dump_json(json_backend):
+    data = {"resourceType": "Patient", "name": [{"text": "Іван"}], "active": True}
+    dumped = utils.dump_json(data)
+    assert isinstance(dumped, bytes)
+    assert utils.load_json(dumped) == data
@@ -1,5 +1,5 @@
 import json
-from unittest.mock import patch, ANY
+from unittest.mock import Mock, patch, ANY
 
 import pytest
 import responses
@@ -720,8 +720,127 @@ def test_requests_config():
         {"resourceType": "Bundle", "type": "searchset", "total": 0, "entry": []}
     )
     resp = MockRequestsResponse(bytes(json_resp_str, "utf-8"), 200)
-    with patch("requests.request", return_value=resp) as patched_request:
+    with patch("requests.Session.request", return_value=resp) as patched_request:
         client.resources("Patient").first()
         patched_request.assert_called_with(
-            ANY, ANY, json=ANY, headers=ANY, verify=False, cert="some_cert"
+            ANY, ANY, data=ANY, headers=ANY, verify=False, cert="some_cert", timeout=120
         )
+
+
+def test_requests_session():
+    json_resp_str = json.dumps(
+        {"resourceType": "Bundle", "type": "searchset", "total": 0, "entry": []}
+    )
+    resp = MockRequestsResponse(bytes(json_resp_str, "utf-8"), 200)
+
+    with SyncFHIRClient(FHIR_SERVER_URL) as client:
+        session = client._requests_session
+        with patch.object(session, "request", return_value=resp) as patched_request:
+            client.resources("Patient").first()
+            client.resources("Patient").first()
+            assert patched_request.call_count == 2
+
+    custom_session = Mock()
+    custom_session.request.return_value = resp
+    client = SyncFHIRClient(FHIR_SERVER_URL, requests_config={"session": custom_session})
+    client.resources("Patient").first()
+    custom_session.request.assert_called_once_with(
+        ANY, ANY, data=ANY, headers=ANY, timeout=120
+    )
+    client.close()
+    custom_session.close.assert_not_called()
+
+
+def test_requests_session_none():
+    json_resp_str = json.dumps(
+        {"resourceType": "Bundle", "type": "searchset", "total": 0, "entry": []}
+    )
+    resp = MockRequestsResponse(bytes(json_resp_str, "utf-8"), 200)
+
+    with SyncFHIRClient(FHIR_SERVER_URL, requests_config={"session": None}) as client:
+        with patch("requests.Session.request", return_value=resp) as patched_request:
+            client.resources("Patient").first()
+            patched_request.assert_called_once_with(
+                ANY, ANY, data=ANY, headers=ANY, timeout=120
+            )
+
+
+@pytest.mark.parametrize(
+    "status_code,content,exception",
+    [
+        (404, b"Not found", ResourceNotFound),
+        (410, b"Gone", ResourceNotFound),
+        (412, b"Multiple matches", MultipleResourcesFound),
+        (500, b"Internal server error", OperationOutcome),
+        (400, b'{"resourceType": "Patient"}', OperationOutcome),
+    ],
+)
+def test_error_response(status_code, content, exception):
+    client = SyncFHIRClient(FHIR_SERVER_URL)
+    resp = MockRequestsResponse(content, status_code)
+    with patch("requests.Session.request", return_value=resp):
+        with pytest.raises(exception):
+            client.reference("Patient", "p1").to_resource()
+
+
+@pytest.mark.parametrize(
+    "content,content_type",
+    [
+        ("Ошибка сервера".encode("utf-8"), "text/plain"),
+        ("Ошибка сервера".encode("cp1251"), "text/plain; charset=cp1251"),
+    ],
+)
+def test_error_response_charset(content, content_type):
+    client = SyncFHIRClient(FHIR_SERVER_URL)
+    resp = MockRequestsResponse(content, 500, content_type=content_type)
+    with patch("requests.Session.request", return_value=resp):
+        with pytest.raises(OperationOutcome) as exc:
+            client.reference("Patient", "p1").to_resource()
+    assert exc.value.resource["issue"][0]["diagnostics"] == "Ошибка сервера"
+
+
+def test_error_response_operation_outcome():
+    client = SyncFHIRClient(FHIR_SERVER_URL)
+    outcome = {
+        "resourceType": "OperationOutcome",
+        "issue": [{"severity": "error", "code": "invalid", "diagnostics": "Invalid gender"}],
+    }
+    resp = MockRequestsResponse(bytes(json.dumps(outcome), "utf-8"), 422)
+    with patch("requests.Session.request", return_value=resp):
+        with pytest.raises(OperationOutcome) as exc:
+            client.resource("Patient", gender=True).save()
+    assert exc.value.resource == outcome
+
+
+def test_fetch_raw_wraps_bundle():
+    client = SyncFHIRClient(FHIR_SERVER_URL)
+    bundle = {
+        "resourceType": "Bundle",
+        "type": "searchset",
+        "entry": [
+            {
+                "fullUrl": "Patient/p1",
+                "search": {"mode": "match"},
+                "resource": {"resourceType": "Patient", "id": "p1", "name": [{"text": "John"}]},
+            }
+        ],
+    }
+    resp = MockRequestsResponse(bytes(json.dumps(bundle), "utf-8"), 200)
+    with patch("requests.Session.request", return_value=resp):
+        raw_bundle = client.resources("Patient").fetch_raw()
+
+    assert isinstance(raw_bundle, AttrDict)
+    assert raw_bundle.entry[0].search.mode == "match"
+    assert isinstance(raw_bundle.entry[0].resource, SyncFHIRResource)
+    assert raw_bundle.entry[0].resource.name[0].text == "John"
+
+
+def test_execute_with_serialized_data():
+    client = SyncFHIRClient(FHIR_SERVER_URL)
+    payload = b'{"resourceType":"Parameters"}'
+    resp = MockRequestsResponse(b'{"resourceType":"Parameters"}', 200)
+    with patch("requests.Session.request", return_value=resp) as patched_request:
+        client.execute("Patient/$validate", data=payload)
+        client.execute("Patient/$validate", data={"resourceType": "Parameters"})
+
+    assert [call.kwargs["data"] for call in patched_request.call_args_list] == [payload, payload]
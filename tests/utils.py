@@ -1,11 +1,16 @@
 class MockAiohttpResponse:
-    def __init__(self, text, status):
+    def __init__(self, text, status, charset=None):
         self._text = text
         self.status = status
+        self.content_length = len(text)
+        self.charset = charset
 
     async def text(self):
         return self._text
 
+    async def read(self):
+        return self._text
+
     async def __aexit__(self, exc_type, exc, tb):
         pass
 
@@ -14,7 +19,10 @@ class MockAiohttpResponse:
 
 
 class MockRequestsResponse:
-    def __init__(self, text, status_code):
+    def __init__(self, text, status_code, content_type=None):
         # self.json_data = json_data
         self.status_code = status_code
         self.content = text
+        self.headers = {"Content-Length": str(len(text))}
+        if content_type:
+            self.headers["Content-Type"] = content_type